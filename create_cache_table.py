@@ -1,18 +1,16 @@
 #!/usr/bin/env python
 """
-Script to create cache table for Railway deployment
+Thin wrapper kept for existing deploy configs.
+
+The work now lives in the railway_bootstrap management command so the
+cache table and superuser steps share one django.setup().
 """
 import os
 import django
-from django.core.management import execute_from_command_line
 
 if __name__ == '__main__':
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'auth_service.settings')
     django.setup()
-    
-    # Create cache table
-    try:
-        execute_from_command_line(['manage.py', 'createcachetable'])
-        print("Cache table created successfully!")
-    except Exception as e:
-        print(f"Cache table creation failed or already exists: {e}")
+
+    from django.core.management import call_command
+    call_command('railway_bootstrap')
@@ -1,45 +1,16 @@
 #!/usr/bin/env python
 """
-Script to create a Django superuser for Railway deployment
+Thin wrapper kept for existing deploy configs.
+
+The work now lives in the railway_bootstrap management command so the
+cache table and superuser steps share one django.setup().
 """
 import os
 import django
-from django.contrib.auth import get_user_model
-from django.core.management import execute_from_command_line
 
 if __name__ == '__main__':
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'auth_service.settings')
     django.setup()
-    
-    User = get_user_model()
-    
-    # Check if superuser already exists
-    existing_superusers = User.objects.filter(is_superuser=True)
-    if existing_superusers.exists():
-        print("Superuser already exists!")
-        for user in existing_superusers:
-            print(f"Existing superuser email: {user.email}")
-        
-        # Update the first superuser's password with the new one from environment
-        email = os.environ.get('SUPERUSER_EMAIL', 'admin@example.com')
-        password = os.environ.get('SUPERUSER_PASSWORD', 'admin123')
-        
-        # If the environment email matches an existing superuser, update password
-        superuser = existing_superusers.filter(email=email).first()
-        if superuser:
-            superuser.set_password(password)
-            superuser.save()
-            print(f"Updated password for existing superuser: {email}")
-        else:
-            print(f"To login, use one of the existing emails above with the original password")
-            print(f"Or delete the existing superuser and redeploy to create: {email}")
-    else:
-        # Create superuser with environment variables or defaults
-        email = os.environ.get('SUPERUSER_EMAIL', 'admin@example.com')
-        password = os.environ.get('SUPERUSER_PASSWORD', 'admin123')
-        
-        User.objects.create_superuser(
-            email=email,
-            password=password
-        )
-        print(f"Superuser '{email}' created successfully!")
+
+    from django.core.management import call_command
+    call_command('railway_bootstrap')
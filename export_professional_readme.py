@@ -5,21 +5,84 @@ This script converts the comprehensive README.md file to a beautifully formatted
 Word document suitable for documentation, presentations, or project submissions.
 """
 
+import copy
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt, RGBColor
-    from docx.enum.style import WD_STYLE_TYPE
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.table import WD_TABLE_ALIGNMENT
-    from docx.oxml.shared import OxmlElement, qn
+# Bullet prefix shared by TOC and feature bullets; a single interned
+# constant (explicit •, immune to source-encoding mojibake) instead
+# of an f-string build per line
+_BULLET = "• "
+
+# Precompiled markdown patterns (hot path: one match/sub per line)
+_NUMLIST_RE = re.compile(r'^\d+\. ')
+_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+
+# Dispatch prefixes recognized by process_markdown_content, compiled into
+# a character trie so each line is classified with one short walk instead
+# of several slice probes.
+_LINE_PREFIXES = ('# ', '## ', '### ', '#### ', '- ', '- **', '  - ')
+
+
+def _compile_prefix_trie(prefixes):
+    trie = {}
+    for prefix in prefixes:
+        node = trie
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node[''] = prefix  # terminal: longest match seen so far
+    return trie
+
+
+_PREFIX_TRIE = _compile_prefix_trie(_LINE_PREFIXES)
+
+
+def _classify_line(line, _trie=_PREFIX_TRIE):
+    """Return the longest dispatch prefix matching ``line``, else None."""
+    node = _trie
+    match = None
+    for ch in line[:5]:
+        node = node.get(ch)
+        if node is None:
+            break
+        prefix = node.get('')
+        if prefix is not None:
+            match = prefix
+    return match
+
+# Resolved lazily by _load_docx(): importing docx costs ~100-200ms and
+# several MB, which importers of this module shouldn't pay up front
+DOCX_AVAILABLE = None
+
+
+def _load_docx():
+    """Import python-docx on first use and publish its names module-wide."""
+    global DOCX_AVAILABLE
+    if DOCX_AVAILABLE is not None:
+        return DOCX_AVAILABLE
+    try:
+        from docx import Document
+        from docx.shared import Inches, Pt, RGBColor
+        from docx.enum.style import WD_STYLE_TYPE
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.enum.table import WD_TABLE_ALIGNMENT
+        from docx.oxml.shared import OxmlElement, qn
+        from docx.oxml import parse_xml
+    except ImportError:
+        DOCX_AVAILABLE = False
+        return False
+    globals().update(
+        Document=Document, Inches=Inches, Pt=Pt, RGBColor=RGBColor,
+        WD_STYLE_TYPE=WD_STYLE_TYPE, WD_ALIGN_PARAGRAPH=WD_ALIGN_PARAGRAPH,
+        WD_TABLE_ALIGNMENT=WD_TABLE_ALIGNMENT, OxmlElement=OxmlElement,
+        qn=qn, parse_xml=parse_xml,
+    )
     DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+    return True
 
 
 class ProfessionalReadmeExporter:
@@ -33,19 +96,33 @@ class ProfessionalReadmeExporter:
             readme_path (str): Path to the README.md file
             output_path (str): Output path for the Word document (optional)
         """
-        if not DOCX_AVAILABLE:
+        if not _load_docx():
             raise ImportError("python-docx package is required. Install with: pip install python-docx")
         
         self.readme_path = Path(readme_path)
+        # One timestamp per export keeps the filename, footer, cover page
+        # and metadata consistent (and avoids repeated now() calls)
+        self._now = datetime.now()
         if output_path:
             self.output_path = Path(output_path)
         else:
             # Create unique filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._now.strftime("%Y%m%d_%H%M%S")
             self.output_path = self.readme_path.parent / f"User_Authentication_System_Complete_Documentation_{timestamp}.docx"
         
         self.doc = Document()
         self.setup_professional_styles()
+
+        # Handlers for the trie-classified line prefixes (_LINE_PREFIXES)
+        self._line_dispatch = {
+            '# ': self._emit_title,
+            '## ': self._emit_main_heading,
+            '### ': self._emit_sub_heading,
+            '#### ': self._emit_minor_heading,
+            '- **': self._emit_bold_bullet,
+            '- ': self._emit_bullet,
+            '  - ': self._emit_sub_bullet,
+        }
     
     def setup_professional_styles(self):
         """Set up professional, corporate-style document formatting."""
@@ -102,12 +179,15 @@ class ProfessionalReadmeExporter:
         code_style.paragraph_format.space_before = Pt(6)
         code_style.paragraph_format.space_after = Pt(6)
         
-        # Inline code style
+        # Inline code style (cached: Styles.__getitem__ walks the style
+        # list, so don't look it up again per inline-code match)
+        self._inline_code_style = None
         try:
             inline_code_style = add_style_safe('InlineCode', WD_STYLE_TYPE.CHARACTER)
             inline_code_style.font.name = 'Consolas'
             inline_code_style.font.size = Pt(10)
             inline_code_style.font.color.rgb = RGBColor(51, 51, 51)
+            self._inline_code_style = inline_code_style
         except:
             pass
         
@@ -117,29 +197,138 @@ class ProfessionalReadmeExporter:
         feature_style.font.size = Pt(11)
         feature_style.paragraph_format.left_indent = Inches(0.25)
         feature_style.paragraph_format.space_after = Pt(3)
-    
+
+        # Pre-built <w:p> templates: styled text paragraphs are appended as
+        # raw XML via _fast_add_paragraph, skipping the per-call Paragraph
+        # wrapper allocation and style resolution in add_paragraph.
+        p_template = (
+            '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            '<w:pPr><w:pStyle w:val="{}"/></w:pPr><w:r><w:t></w:t></w:r></w:p>'
+        )
+        self._p_templates = {
+            name: parse_xml(p_template.format(name))
+            for name in ('DocumentTitle', 'MainHeading', 'SubHeading', 'MinorHeading')
+        }
+
+        # Templates for the remaining high-volume body paragraphs: code
+        # blocks (shading pre-baked) and unstyled/empty paragraphs
+        self._code_template = parse_xml(
+            '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            '<w:pPr><w:pStyle w:val="CodeBlock"/><w:shd w:fill="F8F9FA"/></w:pPr>'
+            '<w:r></w:r></w:p>'
+        )
+        self._plain_template = parse_xml(
+            '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            '<w:r><w:t></w:t></w:r></w:p>'
+        )
+        self._empty_template = parse_xml(
+            '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
+        )
+
+    def _append_body_element(self, element):
+        """Insert a finished element into the body, before any sectPr."""
+        body = self.doc.element.body
+        sect_pr = body.find(qn('w:sectPr'))
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
+
+    @staticmethod
+    def _set_run_text(t, text):
+        t.text = text
+        if text != text.strip():
+            t.set(qn('xml:space'), 'preserve')
+
+    def _fast_add_paragraph(self, style, text):
+        """Append a styled paragraph to the body as raw XML."""
+        p = copy.deepcopy(self._p_templates[style])
+        self._set_run_text(p[1][0], text)
+        self._append_body_element(p)
+
+    def _fast_add_plain_paragraph(self, text):
+        """Append an unstyled paragraph (no inline formatting) as raw XML."""
+        p = copy.deepcopy(self._plain_template)
+        self._set_run_text(p[0][0], text)
+        self._append_body_element(p)
+
+    def _fast_add_empty_paragraph(self):
+        self._append_body_element(copy.deepcopy(self._empty_template))
+
+    @staticmethod
+    def _build_table_row(cell_specs, size_half_points='20'):
+        """Build a <w:tr> from (text, bold) cell specs without Cell wrappers."""
+        tr = OxmlElement('w:tr')
+        for text, bold in cell_specs:
+            tc = OxmlElement('w:tc')
+            p = OxmlElement('w:p')
+            r = OxmlElement('w:r')
+            rpr = OxmlElement('w:rPr')
+            if bold:
+                rpr.append(OxmlElement('w:b'))
+            sz = OxmlElement('w:sz')
+            sz.set(qn('w:val'), size_half_points)
+            rpr.append(sz)
+            r.append(rpr)
+            t = OxmlElement('w:t')
+            ProfessionalReadmeExporter._set_run_text(t, text)
+            r.append(t)
+            p.append(r)
+            tc.append(p)
+            tr.append(tc)
+        return tr
+
+    def _fast_add_code_block(self, code_text):
+        """Append a shaded code-block paragraph as raw XML.
+
+        Line breaks are emitted as <w:br/> the same way python-docx's run
+        text setter would.
+        """
+        p = copy.deepcopy(self._code_template)
+        run = p[1]
+        for idx, segment in enumerate(code_text.split('\n')):
+            if idx:
+                run.append(OxmlElement('w:br'))
+            if segment:
+                t = OxmlElement('w:t')
+                self._set_run_text(t, segment)
+                run.append(t)
+        self._append_body_element(p)
+
     def add_professional_header_footer(self):
         """Add professional header and footer."""
-        # Header
+        # Header (format the run, not the shared paragraph style: writing
+        # through para.style.font mutated the style for every paragraph
+        # that uses it and forced re-resolution on each add_paragraph)
         header = self.doc.sections[0].header
         header_para = header.paragraphs[0]
-        header_para.text = "User Authentication System - Complete Technical Documentation"
         header_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        header_para.style.font.size = Pt(10)
-        header_para.style.font.color.rgb = RGBColor(68, 68, 68)
-        
+        header_run = header_para.add_run(
+            "User Authentication System - Complete Technical Documentation")
+        header_run.font.size = Pt(10)
+        header_run.font.color.rgb = RGBColor(68, 68, 68)
+
         # Footer
         footer = self.doc.sections[0].footer
         footer_para = footer.paragraphs[0]
-        footer_para.text = f"Generated on {datetime.now().strftime('%B %d, %Y')} | Django REST Framework Authentication Service"
         footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        footer_para.style.font.size = Pt(9)
-        footer_para.style.font.color.rgb = RGBColor(128, 128, 128)
+        footer_run = footer_para.add_run(
+            f"Generated on {self._now.strftime('%B %d, %Y')} | Django REST Framework Authentication Service")
+        footer_run.font.size = Pt(9)
+        footer_run.font.color.rgb = RGBColor(128, 128, 128)
     
-    def add_table_of_contents(self):
-        """Add a table of contents."""
-        self.doc.add_heading('Table of Contents', level=1).style = 'MainHeading'
-        
+    @staticmethod
+    def _harvest_body_elements(doc):
+        """Return the body elements of a scratch document, minus sectPr."""
+        return [child for child in doc.element.body
+                if child.tag != qn('w:sectPr')]
+
+    def _build_toc_elements(self):
+        """Build the table-of-contents section as standalone elements."""
+        doc = Document()
+        heading = doc.add_paragraph('Table of Contents')
+        heading._p.style = 'MainHeading'
+
         toc_items = [
             "What it does",
             "Quick Start",
@@ -152,12 +341,18 @@ class ProfessionalReadmeExporter:
             "Need Help?"
         ]
         
-        for item in toc_items:
-            para = self.doc.add_paragraph(f"• {item}")
-            para.style.font.size = Pt(11)
-            para.paragraph_format.left_indent = Inches(0.25)
-        
-        self.doc.add_page_break()
+        # One paragraph with forced line breaks instead of one <w:p> per
+        # entry; FeatureList already carries the 11pt font and indent
+        para = doc.add_paragraph()
+        para._p.style = 'FeatureList'
+        last = len(toc_items) - 1
+        for index, item in enumerate(toc_items):
+            run = para.add_run(_BULLET + item)
+            if index != last:
+                run.add_break()
+
+        doc.add_page_break()
+        return self._harvest_body_elements(doc)
     
     def add_shading_to_paragraph(self, paragraph, color: str = "F8F9FA"):
         """Add light background shading to code blocks."""
@@ -169,203 +364,221 @@ class ProfessionalReadmeExporter:
         except Exception:
             pass
     
-    def process_table(self, lines: list, start_index: int):
-        """Process markdown tables into Word tables."""
+    def process_table(self, buf, pos: int):
+        """Process markdown tables into Word tables.
+
+        Reads table lines directly from ``buf`` starting at ``pos`` and
+        returns the buffer position of the first line past the table.
+        """
+        size = len(buf)
         table_lines = []
-        i = start_index
-        
+        scan = pos
+        first_line_end = None
+
         # Collect table lines
-        while i < len(lines) and ('|' in lines[i] or lines[i].strip() == ''):
-            if lines[i].strip() and '|' in lines[i]:
-                table_lines.append(lines[i])
-            i += 1
-        
+        while scan < size:
+            nl = buf.find(b'\n', scan)
+            end = size if nl == -1 else nl
+            line = buf[scan:end].decode('utf-8')
+            if not ('|' in line or line.strip() == ''):
+                break
+            if line.strip() and '|' in line:
+                table_lines.append(line)
+            if first_line_end is None:
+                first_line_end = end + 1
+            scan = end + 1
+
         if len(table_lines) < 2:
-            return start_index
-        
-        # Parse table header
-        header_row = [cell.strip() for cell in table_lines[0].split('|')[1:-1] if cell.strip()]
-        
-        # Parse table data (skip separator row)
-        data_rows = []
-        for line in table_lines[2:]:
-            if line.strip():
-                row = [cell.strip() for cell in line.split('|')[1:-1] if cell.strip()]
-                if row and len(row) == len(header_row):
-                    data_rows.append(row)
+            # Nothing renderable; skip just the detected line
+            return first_line_end if first_line_end is not None else size
+
+        # Parse all rows in one pass (row 1 is the separator row)
+        rows = [[cell.strip() for cell in line.split('|')[1:-1]] for line in table_lines]
+        header_row = [cell for cell in rows[0] if cell]
+        data_rows = [row for row in rows[2:] if any(row) and len(row) == len(header_row)]
         
-        # Create Word table
+        # Create Word table; rows are appended as raw <w:tr> elements so
+        # header bold/size are run properties, not shared-style mutations
         if header_row and data_rows:
-            table = self.doc.add_table(rows=1, cols=len(header_row))
+            table = self.doc.add_table(rows=0, cols=len(header_row))
             table.style = 'Table Grid'
             table.alignment = WD_TABLE_ALIGNMENT.LEFT
-            
-            # Style header row
-            header_cells = table.rows[0].cells
-            for j, header in enumerate(header_row):
-                if j < len(header_cells):
-                    header_cells[j].text = header
-                    for paragraph in header_cells[j].paragraphs:
-                        paragraph.style.font.bold = True
-                        paragraph.style.font.size = Pt(10)
-            
-            # Add data rows
+
+            tbl = table._tbl
+            tbl.append(self._build_table_row((cell, True) for cell in header_row))
             for row_data in data_rows:
-                row_cells = table.add_row().cells
-                for j, cell_data in enumerate(row_data):
-                    if j < len(row_cells):
-                        row_cells[j].text = cell_data
-                        for paragraph in row_cells[j].paragraphs:
-                            paragraph.style.font.size = Pt(10)
-        
-        return i - 1
-    
-    def process_markdown_content(self, content: str):
-        """Process markdown content with enhanced formatting."""
-        lines = content.split('\n')
-        i = 0
+                tbl.append(self._build_table_row((cell, False) for cell in row_data))
+
+        return scan
+
+    def process_markdown_content(self, buf):
+        """Process markdown content with enhanced formatting.
+
+        ``buf`` is a bytes-like buffer (typically an mmap of the README);
+        lines are decoded one at a time so the full line list is never
+        materialized.
+        """
+        size = len(buf)
+        pos = 0
+        prev_line = None
         in_code_block = False
         code_lines = []
-        
-        while i < len(lines):
-            line = lines[i].rstrip()
-            
+
+        while pos < size:
+            line_start = pos
+            nl = buf.find(b'\n', pos)
+            end = size if nl == -1 else nl
+            line = buf[pos:end].decode('utf-8').rstrip()
+            pos = end + 1
+
             # Handle code blocks
             if line.startswith('```'):
                 if in_code_block:
                     # End of code block
                     if code_lines:
-                        code_text = '\n'.join(code_lines)
-                        para = self.doc.add_paragraph(code_text, style='CodeBlock')
-                        self.add_shading_to_paragraph(para)
+                        self._fast_add_code_block('\n'.join(code_lines))
                     code_lines = []
                     in_code_block = False
                 else:
                     # Start of code block
                     in_code_block = True
-                i += 1
+                prev_line = line
                 continue
-            
+
             if in_code_block:
                 code_lines.append(line)
-                i += 1
+                prev_line = line
                 continue
-            
+
             # Empty line
             if not line:
                 # Only add paragraph if not following a heading
-                if i > 0 and not lines[i-1].startswith('#'):
-                    self.doc.add_paragraph()
-                i += 1
+                if prev_line is not None and not prev_line.startswith('#'):
+                    self._fast_add_empty_paragraph()
+                prev_line = line
                 continue
-            
-            # Tables
-            if '|' in line and line.count('|') >= 2:
-                i = self.process_table(lines, i)
-                i += 1
+
+            # Tables (two pipes required; resume the scan from the first
+            # hit instead of re-counting the whole line)
+            first_pipe = line.find('|')
+            if first_pipe != -1 and line.find('|', first_pipe + 1) != -1:
+                pos = self.process_table(buf, line_start)
+                prev_line = ''
                 continue
-            
-            # Headers
-            if line.startswith('# '):
-                self.doc.add_paragraph(line[2:], style='DocumentTitle')
-            elif line.startswith('## '):
-                self.doc.add_paragraph(line[3:], style='MainHeading')
-            elif line.startswith('### '):
-                self.doc.add_paragraph(line[4:], style='SubHeading')
-            elif line.startswith('#### '):
-                self.doc.add_paragraph(line[5:], style='MinorHeading')
-            
-            # Feature bullet points with **bold** text
-            elif line.startswith('- **') and line.endswith('**'):
-                # Extract bold text
-                bold_text = line[4:-2]  # Remove '- **' and '**'
-                para = self.doc.add_paragraph()
-                para.style = 'FeatureList'
-                run = para.add_run(f"• {bold_text}")
-                run.bold = True
-            elif line.startswith('- **') and '**' in line:
-                # Handle mixed bold and regular text
-                para = self.doc.add_paragraph()
-                para.style = 'FeatureList'
-                para.add_run("• ")
-                
-                # Process bold parts
-                parts = line[2:].split('**')
-                for idx, part in enumerate(parts):
-                    if idx % 2 == 1:  # Odd indices are bold
-                        run = para.add_run(part)
-                        run.bold = True
-                    else:
-                        para.add_run(part)
-            
-            # Regular bullet points
-            elif line.startswith('- '):
-                para = self.doc.add_paragraph(line[2:], style='List Bullet')
-                self.process_inline_formatting(para)
-            elif line.startswith('  - '):  # Sub-bullets
-                para = self.doc.add_paragraph(line[4:], style='List Bullet 2')
-                self.process_inline_formatting(para)
-            
+
+            # Headers and bullets via a single trie walk over the prefix
+            prefix = _classify_line(line)
+            if prefix is not None:
+                self._line_dispatch[prefix](line)
+
             # Numbered lists
-            elif re.match(r'^\d+\. ', line):
-                content = re.sub(r'^\d+\. ', '', line)
+            elif (numlist_match := _NUMLIST_RE.match(line)):
+                content = line[numlist_match.end():]
                 para = self.doc.add_paragraph(content, style='List Number')
-                self.process_inline_formatting(para)
-            
+                if '`' in content:
+                    self.process_inline_formatting(para)
+
             # Bold standalone lines (like **Using Docker:**)
             elif line.startswith('**') and line.endswith('**'):
                 para = self.doc.add_paragraph()
                 run = para.add_run(line[2:-2])
                 run.bold = True
-            
+
             # Horizontal rule
             elif line.strip() == '---':
                 para = self.doc.add_paragraph('_' * 70)
                 para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
+
             # Regular paragraph
             else:
-                para = self.doc.add_paragraph(line)
-                self.process_inline_formatting(para)
-            
-            i += 1
+                if '`' in line:
+                    para = self.doc.add_paragraph(line)
+                    self.process_inline_formatting(para)
+                else:
+                    self._fast_add_plain_paragraph(line)
+
+            prev_line = line
+
+    def _emit_title(self, line):
+        self._fast_add_paragraph('DocumentTitle', line[2:])
+
+    def _emit_main_heading(self, line):
+        self._fast_add_paragraph('MainHeading', line[3:])
+
+    def _emit_sub_heading(self, line):
+        self._fast_add_paragraph('SubHeading', line[4:])
+
+    def _emit_minor_heading(self, line):
+        self._fast_add_paragraph('MinorHeading', line[5:])
+
+    def _emit_bold_bullet(self, line):
+        """Emit a '- **...' feature bullet with bold segments."""
+        para = self.doc.add_paragraph()
+        para.style = 'FeatureList'
+        if line.endswith('**'):
+            # Entire bullet text is bold
+            run = para.add_run(_BULLET + line[4:-2])
+            run.bold = True
+        else:
+            # Mixed bold and regular text
+            para.add_run(_BULLET)
+            parts = line[2:].split('**')
+            for idx, part in enumerate(parts):
+                if idx % 2 == 1:  # Odd indices are bold
+                    run = para.add_run(part)
+                    run.bold = True
+                else:
+                    para.add_run(part)
+
+    def _emit_bullet(self, line):
+        para = self.doc.add_paragraph(line[2:], style='List Bullet')
+        if '`' in line:
+            self.process_inline_formatting(para)
+
+    def _emit_sub_bullet(self, line):
+        para = self.doc.add_paragraph(line[4:], style='List Bullet 2')
+        if '`' in line:
+            self.process_inline_formatting(para)
     
     def process_inline_formatting(self, paragraph):
-        """Process inline formatting like code, bold, and links."""
+        """Process inline code formatting.
+
+        Callers pre-check the raw line for a backtick, so the regex only
+        ever runs on paragraphs that can actually contain inline code.
+        """
         text = paragraph.text
-        
-        # Process inline code (`code`)
-        if '`' in text:
-            code_pattern = r'`([^`]+)`'
-            matches = list(re.finditer(code_pattern, text))
-            
-            if matches:
-                paragraph.clear()
-                last_end = 0
-                
-                for match in matches:
-                    # Add text before code
-                    if match.start() > last_end:
-                        paragraph.add_run(text[last_end:match.start()])
-                    
-                    # Add code text
-                    code_run = paragraph.add_run(match.group(1))
-                    try:
-                        code_run.style = self.doc.styles['InlineCode']
-                    except:
-                        code_run.font.name = 'Consolas'
-                        code_run.font.size = Pt(10)
-                    
-                    last_end = match.end()
-                
-                # Add remaining text
-                if last_end < len(text):
-                    paragraph.add_run(text[last_end:])
+        matches = list(_INLINE_CODE_RE.finditer(text))
+        if not matches:
+            return
+
+        paragraph.clear()
+        last_end = 0
+
+        for match in matches:
+            # Add text before code
+            if match.start() > last_end:
+                paragraph.add_run(text[last_end:match.start()])
+
+            # Add code text
+            code_run = paragraph.add_run(match.group(1))
+            if self._inline_code_style is not None:
+                code_run.style = self._inline_code_style
+            else:
+                code_run.font.name = 'Consolas'
+                code_run.font.size = Pt(10)
+
+            last_end = match.end()
+
+        # Add remaining text
+        if last_end < len(text):
+            paragraph.add_run(text[last_end:])
     
-    def add_cover_page(self):
-        """Add a professional cover page."""
+    def _build_cover_elements(self):
+        """Build the cover page as standalone elements."""
+        doc = Document()
+
         # Title
-        title_para = self.doc.add_paragraph()
+        title_para = doc.add_paragraph()
         title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         title_para.paragraph_format.space_before = Pt(72)
         
@@ -376,7 +589,7 @@ class ProfessionalReadmeExporter:
         title_run.font.color.rgb = RGBColor(0, 51, 102)
         
         # Subtitle
-        subtitle_para = self.doc.add_paragraph()
+        subtitle_para = doc.add_paragraph()
         subtitle_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         subtitle_para.paragraph_format.space_before = Pt(12)
         
@@ -386,7 +599,7 @@ class ProfessionalReadmeExporter:
         subtitle_run.font.color.rgb = RGBColor(68, 68, 68)
         
         # Description
-        desc_para = self.doc.add_paragraph()
+        desc_para = doc.add_paragraph()
         desc_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         desc_para.paragraph_format.space_before = Pt(36)
         
@@ -396,16 +609,17 @@ class ProfessionalReadmeExporter:
         desc_run.font.italic = True
         
         # Date
-        date_para = self.doc.add_paragraph()
+        date_para = doc.add_paragraph()
         date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         date_para.paragraph_format.space_before = Pt(72)
         
-        date_run = date_para.add_run(datetime.now().strftime("%B %d, %Y"))
+        date_run = date_para.add_run(self._now.strftime("%B %d, %Y"))
         date_run.font.name = 'Calibri'
         date_run.font.size = Pt(12)
-        
-        self.doc.add_page_break()
-    
+
+        doc.add_page_break()
+        return self._harvest_body_elements(doc)
+
     def export(self) -> str:
         """
         Export the README.md to a professional Word document.
@@ -416,44 +630,58 @@ class ProfessionalReadmeExporter:
         if not self.readme_path.exists():
             raise FileNotFoundError(f"README file not found: {self.readme_path}")
         
-        # Read the README file
-        with open(self.readme_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # Add cover page
-        self.add_cover_page()
-        
-        # Add table of contents
-        self.add_table_of_contents()
-        
-        # Add header and footer
-        self.add_professional_header_footer()
-        
-        # Process the markdown content
-        self.process_markdown_content(content)
-        
-        # Add document metadata page
-        self.doc.add_page_break()
-        self.add_document_metadata()
-        
+        # Memory-map the README so lines are decoded lazily during
+        # processing instead of holding the full text plus a line list
+        with open(self.readme_path, 'rb') as file:
+            content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            # Cover page, TOC and metadata are independent of the body;
+            # build them concurrently while the main thread processes the
+            # markdown content, then splice them in document order.
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                cover_future = pool.submit(self._build_cover_elements)
+                toc_future = pool.submit(self._build_toc_elements)
+                metadata_future = pool.submit(self._build_metadata_elements)
+
+                # Add header and footer
+                self.add_professional_header_footer()
+
+                # Process the markdown content
+                self.process_markdown_content(content)
+
+                front_matter = cover_future.result() + toc_future.result()
+                back_matter = metadata_future.result()
+        finally:
+            content.close()
+
+        body = self.doc.element.body
+        for index, element in enumerate(front_matter):
+            body.insert(index, element)
+        for element in back_matter:
+            self._append_body_element(element)
+
         # Save the document
         self.doc.save(self.output_path)
-        
+
         return str(self.output_path)
     
-    def add_document_metadata(self):
-        """Add comprehensive document metadata."""
-        self.doc.add_heading('Document Information', level=1).style = 'MainHeading'
-        
+    def _build_metadata_elements(self):
+        """Build the document metadata page as standalone elements."""
+        doc = Document()
+        doc.add_page_break()
+        heading = doc.add_paragraph('Document Information')
+        heading._p.style = 'MainHeading'
+
         # Create metadata table
-        table = self.doc.add_table(rows=8, cols=2)
+        table = doc.add_table(rows=0, cols=2)
         table.style = 'Table Grid'
         table.alignment = WD_TABLE_ALIGNMENT.LEFT
-        
+
         metadata = [
             ['Document Title', 'User Authentication System - Complete Technical Documentation'],
             ['Project Type', 'Django REST Framework Authentication Service'],
-            ['Generated Date', datetime.now().strftime('%B %d, %Y at %I:%M %p')],
+            ['Generated Date', self._now.strftime('%B %d, %Y at %I:%M %p')],
             ['Source File', str(self.readme_path.name)],
             ['Technologies', 'Django, PostgreSQL, Redis, Docker, JWT'],
             ['API Documentation', 'Swagger/OpenAPI available'],
@@ -461,20 +689,11 @@ class ProfessionalReadmeExporter:
             ['Deployment Ready', 'Railway, Render, Heroku compatible']
         ]
         
-        for i, (label, value) in enumerate(metadata):
-            row_cells = table.rows[i].cells
-            row_cells[0].text = label
-            row_cells[1].text = value
-            
-            # Style the cells
-            for paragraph in row_cells[0].paragraphs:
-                for run in paragraph.runs:
-                    run.font.bold = True
-                    run.font.size = Pt(10)
-            
-            for paragraph in row_cells[1].paragraphs:
-                for run in paragraph.runs:
-                    run.font.size = Pt(10)
+        tbl = table._tbl
+        for label, value in metadata:
+            tbl.append(self._build_table_row([(label, True), (value, False)]))
+
+        return self._harvest_body_elements(doc)
 
 
 def main():
@@ -483,7 +702,7 @@ def main():
     readme_path = current_dir / "README.md"
     
     try:
-        if not DOCX_AVAILABLE:
+        if not _load_docx():
             print("❌ Missing required package!")
             print("📦 Please install python-docx first:")
             print("   pip install python-docx")
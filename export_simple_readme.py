@@ -0,0 +1,465 @@
+"""
+Simple README to Word Document Exporter
+
+This script converts the README.md file to a simply formatted Word
+document. It is the lightweight alternative to
+export_professional_readme.py, without the cover page and table of
+contents.
+"""
+
+import hashlib
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from pathlib import Path
+from datetime import datetime
+
+try:
+    from docx import Document
+    from docx.shared import Inches, Pt, RGBColor
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import parse_xml
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+
+class ReadmeToWordExporter:
+    """Export README.md to a simply formatted Word document."""
+
+    # Precompiled markdown patterns (shared by all instances; one
+    # match/finditer per line without a regex-cache lookup)
+    _ORDERED_LIST_RE = re.compile(r'^\d+\.\s')
+    _INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+    _CODE_FENCE_RE = re.compile(r'^```')
+
+    # Markdown prefix -> (paragraph style, needs inline formatting).
+    # One partition + dict lookup replaces the startswith cascade.
+    _PREFIX_DISPATCH = {
+        '#': ('CustomTitle', False),
+        '##': ('CustomHeading1', False),
+        '###': ('CustomHeading2', False),
+        '####': ('CustomHeading3', False),
+        '-': ('List Bullet', True),
+        '*': ('List Bullet', True),
+    }
+
+    def __init__(self, readme_path: str, output_path: str = None):
+        """
+        Initialize the exporter.
+
+        Args:
+            readme_path (str): Path to the README.md file
+            output_path (str): Output path for the Word document (optional)
+        """
+        if not DOCX_AVAILABLE:
+            raise ImportError("python-docx package is required. Install with: pip install python-docx")
+
+        self.readme_path = Path(readme_path)
+        if output_path:
+            self.output_path = Path(output_path)
+        else:
+            self.output_path = self.readme_path.parent / "User_Authentication_System_Documentation.docx"
+
+        self.doc = Document()
+        self.setup_styles()
+
+        # Persistent trailing anchor: insert_paragraph_before against it
+        # is O(1) per call, while Document.add_paragraph rescans the body
+        # every time (quadratic over a long README)
+        self._anchor = self.doc.add_paragraph()
+
+    def _add_paragraph(self, text='', style=None):
+        """Insert a paragraph before the trailing anchor."""
+        return self._anchor.insert_paragraph_before(text, style)
+
+    def setup_styles(self):
+        """Set up the document styles used by the converter."""
+        styles = self.doc.styles
+
+        def add_style_safe(name, style_type):
+            try:
+                return styles.add_style(name, style_type)
+            except ValueError:
+                return styles[name]
+
+        # Title style
+        title_style = add_style_safe('CustomTitle', WD_STYLE_TYPE.PARAGRAPH)
+        title_style.font.name = 'Calibri'
+        title_style.font.size = Pt(24)
+        title_style.font.bold = True
+        title_style.font.color.rgb = RGBColor(0, 51, 102)
+        title_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        title_style.paragraph_format.space_after = Pt(12)
+
+        # Heading styles (H2-H4)
+        h1_style = add_style_safe('CustomHeading1', WD_STYLE_TYPE.PARAGRAPH)
+        h1_style.font.name = 'Calibri'
+        h1_style.font.size = Pt(16)
+        h1_style.font.bold = True
+        h1_style.font.color.rgb = RGBColor(0, 51, 102)
+        h1_style.paragraph_format.space_before = Pt(12)
+        h1_style.paragraph_format.space_after = Pt(6)
+
+        h2_style = add_style_safe('CustomHeading2', WD_STYLE_TYPE.PARAGRAPH)
+        h2_style.font.name = 'Calibri'
+        h2_style.font.size = Pt(13)
+        h2_style.font.bold = True
+        h2_style.font.color.rgb = RGBColor(68, 68, 68)
+        h2_style.paragraph_format.space_before = Pt(9)
+        h2_style.paragraph_format.space_after = Pt(4)
+
+        h3_style = add_style_safe('CustomHeading3', WD_STYLE_TYPE.PARAGRAPH)
+        h3_style.font.name = 'Calibri'
+        h3_style.font.size = Pt(11)
+        h3_style.font.bold = True
+        h3_style.font.color.rgb = RGBColor(68, 68, 68)
+        h3_style.paragraph_format.space_before = Pt(6)
+        h3_style.paragraph_format.space_after = Pt(3)
+
+        # Code block style
+        code_style = add_style_safe('CodeBlock', WD_STYLE_TYPE.PARAGRAPH)
+        code_style.font.name = 'Consolas'
+        code_style.font.size = Pt(9)
+        code_style.paragraph_format.left_indent = Inches(0.3)
+        code_style.paragraph_format.space_before = Pt(4)
+        code_style.paragraph_format.space_after = Pt(4)
+
+        # Inline code style
+        self._inline_code_style = None
+        try:
+            inline_code_style = add_style_safe('InlineCode', WD_STYLE_TYPE.CHARACTER)
+            inline_code_style.font.name = 'Consolas'
+            inline_code_style.font.size = Pt(10)
+            inline_code_style.font.color.rgb = RGBColor(51, 51, 51)
+            self._inline_code_style = inline_code_style
+        except:
+            pass
+
+        # Cache the hot-path style objects once; Styles.__getitem__ walks
+        # the style collection on every by-name lookup
+        self._code_block_style = code_style
+
+    def add_header_footer(self):
+        """Add a simple header and footer."""
+        # Resolve the section once; each sections[0] access walks the
+        # document XML again
+        section = self.doc.sections[0]
+
+        header_para = section.header.paragraphs[0]
+        header_para.text = "User Authentication System Documentation"
+        header_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        footer_para = section.footer.paragraphs[0]
+        footer_para.text = f"Generated on {datetime.now().strftime('%B %d, %Y')}"
+        footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    def add_document_info(self):
+        """Add a short document information table at the end."""
+        self.doc.add_paragraph('Document Information', style='CustomHeading1')
+
+        info = [
+            ['Document', 'User Authentication System Documentation'],
+            ['Generated', datetime.now().strftime('%B %d, %Y at %I:%M %p')],
+            ['Source', str(self.readme_path.name)],
+            ['Project', 'Django REST Framework Authentication Service'],
+        ]
+
+        table = self.doc.add_table(rows=len(info), cols=2)
+        table.style = 'Table Grid'
+
+        cells = table._cells
+        for i, (label, value) in enumerate(info):
+            cells[2 * i].text = label
+            cells[2 * i + 1].text = value
+
+    # Parsed <w:shd> elements by fill color; parse once, deepcopy per use
+    _shading_templates = {}
+
+    def add_shading_to_paragraph(self, paragraph, color: str = "F5F5F5"):
+        """Add light background shading to a code block paragraph."""
+        try:
+            template = self._shading_templates.get(color)
+            if template is None:
+                shading_xml = f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:fill="{color}"/>'
+                template = self._shading_templates[color] = parse_xml(shading_xml)
+            paragraph._element.get_or_add_pPr().append(deepcopy(template))
+        except Exception:
+            pass
+
+    @classmethod
+    def _section_renderer(cls):
+        """Build a renderer around a scratch document for one section."""
+        renderer = cls.__new__(cls)
+        renderer.doc = Document()
+        renderer.setup_styles()
+        renderer._anchor = renderer.doc.add_paragraph()
+        return renderer
+
+    def _split_sections(self, lines: list):
+        """Split the lines at top-level '## ' headings (fence-aware)."""
+        sections = [[]]
+        in_code_block = False
+        for line in lines:
+            if self._CODE_FENCE_RE.match(line):
+                in_code_block = not in_code_block
+            elif not in_code_block and line.startswith('## ') and sections[-1]:
+                sections.append([])
+            sections[-1].append(line)
+        return sections
+
+    def _render_section_fragment(self, section_lines: list):
+        """Render one section in a scratch document; return its body elements."""
+        renderer = self._section_renderer()
+        renderer._render_segments(section_lines)
+
+        body = renderer.doc.element.body
+        body.remove(renderer._anchor._p)
+        return [child for child in body if not child.tag.endswith('}sectPr')]
+
+    def _render_segments(self, lines: list):
+        """Render a run of markdown lines into this renderer's document."""
+        for kind, payload in self._segment(lines):
+            if kind == 'line':
+                self.process_markdown_line(payload)
+            elif kind == 'code':
+                self.process_code_block(payload)
+            else:
+                self.process_table(payload)
+
+    @staticmethod
+    def _is_table_line(line: str):
+        """True when the line holds at least two pipes.
+
+        Two find() calls stop at the second pipe, where the previous
+        'in' + count() pair scanned the whole line twice.
+        """
+        first = line.find('|')
+        return first != -1 and line.find('|', first + 1) != -1
+
+    def _segment(self, lines: list):
+        """
+        Tokenize the README into ('line' | 'code' | 'table', payload)
+        segments in a single pass, so the render loop dispatches each
+        segment once instead of re-inspecting lines branch by branch.
+        """
+        i = 0
+        n = len(lines)
+        while i < n:
+            line = lines[i]
+
+            if self._CODE_FENCE_RE.match(line):
+                code_lines = []
+                i += 1
+                while i < n and not self._CODE_FENCE_RE.match(lines[i]):
+                    code_lines.append(lines[i])
+                    i += 1
+                i += 1
+                if code_lines:
+                    yield 'code', code_lines
+            elif self._is_table_line(line):
+                table_lines = []
+                start = i
+                while i < n and '|' in lines[i]:
+                    if lines[i].strip():
+                        table_lines.append(lines[i])
+                    i += 1
+                if len(table_lines) >= 2:
+                    yield 'table', table_lines
+                else:
+                    i = start + 1
+            else:
+                yield 'line', line
+                i += 1
+
+    def process_code_block(self, code_lines: list):
+        """Emit a fenced code block."""
+        # Stream the lines straight into runs with explicit line breaks;
+        # no interim '\n'.join allocation proportional to the block size
+        para = self._add_paragraph(style=self._code_block_style)
+        add_run = para.add_run
+        for idx, code_line in enumerate(code_lines):
+            if idx:
+                add_run().add_break()
+            if code_line:
+                add_run(code_line)
+        self.add_shading_to_paragraph(para)
+
+    def process_table(self, table_lines: list):
+        """Emit a markdown table."""
+        header_row = [cell.strip() for cell in table_lines[0].split('|')[1:-1] if cell.strip()]
+        data_rows = []
+        for line in table_lines[2:]:
+            row = [cell.strip() for cell in line.split('|')[1:-1] if cell.strip()]
+            if row and len(row) == len(header_row):
+                data_rows.append(row)
+
+        if header_row and data_rows:
+            ncols = len(header_row)
+            table = self.doc.add_table(rows=1 + len(data_rows), cols=ncols)
+            table.style = 'Table Grid'
+            # add_table appends after the anchor; move it into place
+            self._anchor._p.addprevious(table._tbl)
+
+            # Fetch the cell grid once: the .cells accessor rebuilds it
+            # on every access, which is quadratic over table rows
+            cells = table._cells
+            for j, header in enumerate(header_row):
+                cell = cells[j]
+                cell.text = header
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        run.font.bold = True
+
+            for r, row_data in enumerate(data_rows, start=1):
+                base = r * ncols
+                for j, cell_data in enumerate(row_data):
+                    cells[base + j].text = cell_data
+
+    def process_markdown_line(self, line: str):
+        """Convert a single markdown line into a document paragraph."""
+        head, sep, rest = line.partition(' ')
+        dispatch = self._PREFIX_DISPATCH.get(head) if sep else None
+
+        if dispatch is not None:
+            style, has_inline = dispatch
+            if has_inline and '`' in rest:
+                self._emit_inline(self._add_paragraph(style=style), rest)
+            else:
+                self._add_paragraph(rest, style=style)
+        elif line.startswith('  - '):
+            # Indented sub-bullet; space-led lines partition to an empty
+            # head, so the prefix dispatch above never sees them
+            content = line[4:]
+            if '`' in content:
+                self._emit_inline(self._add_paragraph(style='List Bullet 2'), content)
+            else:
+                self._add_paragraph(content, style='List Bullet 2')
+        elif self._ORDERED_LIST_RE.match(line):
+            content = self._ORDERED_LIST_RE.sub('', line, count=1)
+            if '`' in content:
+                self._emit_inline(self._add_paragraph(style='List Number'), content)
+            else:
+                self._add_paragraph(content, style='List Number')
+        elif line.startswith('**') and line.endswith('**'):
+            para = self._add_paragraph()
+            run = para.add_run(line[2:-2])
+            run.bold = True
+        elif line.strip() == '---':
+            para = self._add_paragraph('_' * 60)
+            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        elif '`' in line:
+            self._emit_inline(self._add_paragraph(), line)
+        else:
+            self._add_paragraph(line)
+
+    def _emit_inline(self, paragraph, text):
+        """Build a paragraph's runs directly from the inline-code tokens.
+
+        Callers check for a backtick first, so the regex engine never
+        runs on the plain-text common path; the paragraph arrives empty,
+        avoiding a clear()-and-rebuild round trip.
+        """
+        last_end = 0
+        for match in self._INLINE_CODE_RE.finditer(text):
+            if match.start() > last_end:
+                paragraph.add_run(text[last_end:match.start()])
+
+            code_run = paragraph.add_run(match.group(1))
+            if self._inline_code_style is not None:
+                code_run.style = self._inline_code_style
+            else:
+                code_run.font.name = 'Consolas'
+                code_run.font.size = Pt(10)
+
+            last_end = match.end()
+
+        if last_end < len(text):
+            paragraph.add_run(text[last_end:])
+
+    def export(self) -> str:
+        """
+        Export the README.md to a Word document.
+
+        Returns:
+            str: Path to the generated Word document
+        """
+        if not self.readme_path.exists():
+            raise FileNotFoundError(f"README file not found: {self.readme_path}")
+
+        with open(self.readme_path, 'rb') as file:
+            readme_bytes = file.read()
+
+        # Skip the whole render when the README is unchanged since the
+        # last run: hashing the input is cheap next to building the
+        # document, and repeat CI runs become a no-op
+        digest = hashlib.sha256(readme_bytes).hexdigest()
+        sidecar = self.output_path.with_suffix('.sha256')
+        if self.output_path.exists() and sidecar.exists() and sidecar.read_text().strip() == digest:
+            return str(self.output_path)
+
+        # Split once; trailing whitespace is stripped in the same pass so
+        # the segmenter and code-block collector reuse clean lines
+        # instead of calling rstrip per visit
+        lines = [line.rstrip() for line in readme_bytes.decode('utf-8').splitlines()]
+
+        self.add_header_footer()
+
+        sections = self._split_sections(lines)
+        if len(sections) > 1:
+            # Render each '## ' section into its own scratch document
+            # concurrently, then splice the fragments into the body in
+            # order; lxml's tree building releases the GIL enough for
+            # the sections to overlap
+            anchor_p = self._anchor._p
+            with ThreadPoolExecutor(max_workers=min(4, len(sections))) as pool:
+                for fragment in pool.map(self._render_section_fragment, sections):
+                    for element in fragment:
+                        anchor_p.addprevious(element)
+        else:
+            self._render_segments(lines)
+
+        # The body is complete; drop the anchor before the info section
+        anchor_p = self._anchor._p
+        anchor_p.getparent().remove(anchor_p)
+
+        self.doc.add_page_break()
+        self.add_document_info()
+
+        self.doc.save(self.output_path)
+        sidecar.write_text(digest)
+
+        return str(self.output_path)
+
+
+def main():
+    """Main function to export README to a Word document."""
+    current_dir = Path(__file__).parent
+    readme_path = current_dir / "README.md"
+
+    try:
+        if not DOCX_AVAILABLE:
+            print("Missing required package!")
+            print("Please install python-docx first:")
+            print("   pip install python-docx")
+            return
+
+        exporter = ReadmeToWordExporter(readme_path)
+        generated_file = exporter.export()
+
+        print("Successfully exported README to Word document!")
+        print(f"Generated file: {generated_file}")
+        print(f"File size: {os.path.getsize(generated_file) / 1024:.1f} KB")
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+    except ImportError as e:
+        print(f"Import Error: {e}")
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+
+if __name__ == "__main__":
+    main()
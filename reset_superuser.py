@@ -12,13 +12,10 @@ if __name__ == '__main__':
     
     User = get_user_model()
     
-    # Delete all existing superusers
-    existing_superusers = User.objects.filter(is_superuser=True)
-    if existing_superusers.exists():
-        for user in existing_superusers:
-            print(f"Deleting existing superuser: {user.email}")
-            user.delete()
-        print("All existing superusers deleted!")
+    # Delete all existing superusers in one bulk query
+    deleted_count, _ = User.objects.filter(is_superuser=True).delete()
+    if deleted_count:
+        print(f"Deleted {deleted_count} existing superuser(s)!")
     
     # Create new superuser
     email = os.environ.get('SUPERUSER_EMAIL', 'admin@example.com')
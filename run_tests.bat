@@ -1,6 +1,6 @@
 @echo off
 echo Running all tests...
-python manage.py test users.tests
+python manage.py test users.tests --parallel auto --timing
 
 echo.
 echo Running registration tests...
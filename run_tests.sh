@@ -1,9 +1,9 @@
 #!/bin/bash
 set -e
 
-# Run all tests with verbose output
+# Run all tests across one worker per CPU core
 echo "Running all tests..."
-python manage.py test users.tests
+python manage.py test users.tests --parallel auto --timing
 
 # Run specific test modules
 echo -e "\nRunning registration tests..."
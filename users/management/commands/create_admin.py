@@ -14,10 +14,10 @@ class Command(BaseCommand):
         email = options.get('email') or 'davididuate11@gmail.com'
         password = options.get('password') or 'admin123'
         
-        if User.objects.filter(email=email).exists():
+        user = User.objects.filter(email=email).first()
+        if user is not None:
             self.stdout.write(f'User with email {email} already exists')
             # Update password for existing user
-            user = User.objects.get(email=email)
             user.set_password(password)
             user.is_staff = True
             user.is_superuser = True
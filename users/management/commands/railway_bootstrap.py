@@ -0,0 +1,36 @@
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+User = get_user_model()
+
+class Command(BaseCommand):
+    help = 'Run all Railway boot steps (cache table + superuser) in one Django process'
+
+    def handle(self, *args, **options):
+        # Create cache table for password reset tokens
+        try:
+            call_command('createcachetable')
+            self.stdout.write('Cache table created successfully!')
+        except Exception as e:
+            self.stdout.write(f'Cache table creation failed or already exists: {e}')
+
+        # Create or refresh the superuser in a single round-trip
+        email = os.environ.get('SUPERUSER_EMAIL', 'admin@example.com')
+        password = os.environ.get('SUPERUSER_PASSWORD', 'admin123')
+
+        with transaction.atomic():
+            user, created = User.objects.get_or_create(
+                email=email,
+                defaults={'is_superuser': True, 'is_staff': True},
+            )
+            user.set_password(password)
+            user.save(update_fields=['password'])
+
+        if created:
+            self.stdout.write(self.style.SUCCESS(f"Superuser '{email}' created successfully!"))
+        else:
+            self.stdout.write(f'Superuser already exists - updated password for: {email}')
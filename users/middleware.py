@@ -8,6 +8,11 @@ class AuthorizationHeaderMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        if 'Authorization' in request.headers and 'HTTP_AUTHORIZATION' not in request.META:
-            request.META['HTTP_AUTHORIZATION'] = request.headers['Authorization']
+        # Work on request.META directly: request.headers lazily builds
+        # an HttpHeaders mapping, which is wasted work on the fast path
+        # where the header is already normalized (or absent)
+        if 'HTTP_AUTHORIZATION' not in request.META:
+            alt = request.META.get('Authorization')
+            if alt:
+                request.META['HTTP_AUTHORIZATION'] = alt
         return self.get_response(request)
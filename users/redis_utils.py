@@ -1,3 +1,5 @@
+import base64
+import functools
 import redis
 import secrets
 import logging
@@ -7,50 +9,68 @@ from django.core.cache import cache
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Try to connect to Redis or use Django's default cache as a fallback
-try:
-    redis_client = redis.from_url(settings.REDIS_URL)
-    redis_available = True
-except redis.exceptions.ConnectionError:
-    logger.warning("Redis connection failed. Using Django cache as fallback.")
-    redis_client = None
-    redis_available = False
+# Bound method cached at module level for the token hot path
+_B64 = base64.urlsafe_b64encode
 
 
-def generate_password_reset_token(user_id):
+@functools.lru_cache(maxsize=1)
+def get_redis_client():
+    """
+    Build the shared Redis client lazily on first use.
+
+    The client sits on a connection pool, so sockets are reused across
+    requests instead of being set up per call, and Django workers no
+    longer pay a Redis connection at import time. Connection failures
+    surface per command, so the cache fallback below retries Redis after
+    a transient outage instead of being stuck on it for the process
+    lifetime.
+    """
+    return redis.Redis(
+        connection_pool=redis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=32,
+            socket_timeout=0.25,
+        )
+    )
+
+
+def generate_password_reset_token(user_id, client=None):
     """
     Generate a random token for password reset and store it in Redis or Django cache.
-    
+
     Args:
         user_id: The ID of the user requesting a password reset
-        
+        client: An existing Redis client to reuse (defaults to the
+            shared pooled client)
+
     Returns:
         str: The generated token
     """
-    # Generate a secure random token
-    token = secrets.token_urlsafe(32)
+    # Generate a secure random token; same output as
+    # secrets.token_urlsafe(32) without its wrapper overhead
+    token = _B64(secrets.token_bytes(32)).rstrip(b'=').decode('ascii')
     
     # Store the token with an expiry time of 10 minutes (600 seconds)
     key = f"password_reset:{token}"
-    
-    # First try storing in Redis if available
-    redis_success = False
-    if redis_available and redis_client:
-        try:
-            redis_client.setex(key, 600, str(user_id))
-            redis_success = True
-        except Exception as e:
-            logger.error(f"Redis error storing token: {str(e)}")
-    
-    # If Redis failed or is not available, fallback to Django's cache
-    if not redis_success:
-        try:
-            cache.set(key, str(user_id), timeout=600)
+    value = str(user_id)
+
+    # First try storing in Redis; SETEX writes the value and the expiry
+    # in one round-trip
+    try:
+        (client or get_redis_client()).setex(key, 600, value)
+        return token
+    except Exception as e:
+        logger.error(f"Redis error storing token: {str(e)}")
+
+    # Redis failed, fallback to Django's cache
+    try:
+        cache.set(key, value, timeout=600)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(f"Token stored in Django cache: {token[:6]}...")
-        except Exception as e:
-            logger.error(f"Cache error storing token: {str(e)}")
-            # Even if both Redis and cache fail, return a token so the app doesn't crash
-    
+    except Exception as e:
+        logger.error(f"Cache error storing token: {str(e)}")
+        # Even if both Redis and cache fail, return a token so the app doesn't crash
+
     return token
 
 
@@ -68,18 +88,20 @@ def validate_password_reset_token(token):
     key = f"password_reset:{token}"
     user_id = None
     
-    # First try Redis if available
-    if redis_available and redis_client:
-        try:
-            user_id_bytes = redis_client.get(key)
-            if user_id_bytes:
-                user_id = user_id_bytes.decode('utf-8')
-                # Delete the token to prevent reuse
-                redis_client.delete(key)
-                return user_id
-        except Exception as e:
-            logger.error(f"Redis error validating token: {str(e)}")
-            # Continue to try the cache fallback
+    # First try Redis
+    try:
+        # Pipeline the GET and the delete-to-prevent-reuse into one
+        # round-trip; executed atomically, so a token can never be
+        # redeemed twice by concurrent requests
+        pipe = get_redis_client().pipeline()
+        pipe.get(key)
+        pipe.delete(key)
+        user_id_bytes, _ = pipe.execute()
+        if user_id_bytes:
+            return user_id_bytes.decode('utf-8')
+    except Exception as e:
+        logger.error(f"Redis error validating token: {str(e)}")
+        # Continue to try the cache fallback
     
     # Then try Django's cache as a fallback
     try:
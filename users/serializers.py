@@ -15,14 +15,19 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         model = User
         fields = ['email', 'full_name', 'password', 'password_confirm']
     
+    def to_internal_value(self, data):
+        # Pop the confirmation as soon as fields are deserialized so
+        # validated_data reaches create() ready for create_user(**...)
+        data = super().to_internal_value(data)
+        self._password_confirm = data.pop('password_confirm')
+        return data
+
     def validate(self, data):
-        if data.get('password') != data.get('password_confirm'):
+        if data['password'] != self._password_confirm:
             raise serializers.ValidationError({'password_confirm': 'Passwords do not match'})
         return data
-    
+
     def create(self, validated_data):
-        # Remove password_confirm from validated_data
-        validated_data.pop('password_confirm')
         user = User.objects.create_user(**validated_data)
         return user
 
@@ -53,6 +58,7 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
     new_password_confirm = serializers.CharField(write_only=True, style={'input_type': 'password'})
     
     def validate(self, data):
-        if data.get('new_password') != data.get('new_password_confirm'):
+        # Both fields are required, so they are guaranteed present here
+        if data['new_password'] != data['new_password_confirm']:
             raise serializers.ValidationError({'new_password_confirm': 'Passwords do not match'})
         return data
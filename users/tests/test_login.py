@@ -1,24 +1,43 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework import status
-from unittest.mock import patch
+from unittest.mock import ANY, patch
+from parameterized import parameterized
+
+from users.views import UserLoginView
 
 User = get_user_model()
 
+# Resolved once at import; every client.post against the string path
+# would re-run the resolver's pattern matching
+LOGIN_URL = reverse('users:login')
+
+# MD5 hashing keeps per-test password costs negligible; the default
+# PBKDF2 hasher dominates the suite's CPU time otherwise
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class LoginTests(TestCase):
     """Test the user login API with thorough test cases."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.login_url = '/api/v1/users/login/'
-        # Create a test user for login tests
-        self.test_user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # Create the test user once per class instead of per test; each
+        # test still sees it through the per-test transaction rollback
+        cls.test_user = User.objects.create_user(
             email='testuser@example.com',
             password='testpassword123',
             full_name='Test User'
         )
 
+    def setUp(self):
+        self.client = APIClient()
+        self.login_url = LOGIN_URL
+        # For tests that only exercise the view logic, calling the view
+        # directly skips URL resolution and the middleware stack
+        self.factory = APIRequestFactory()
+        self.login_view = UserLoginView.as_view()
+
     def test_login_successful(self):
         """Test successful login with valid credentials."""
         payload = {
@@ -34,57 +53,82 @@ class LoginTests(TestCase):
         self.assertEqual(response.data['user']['email'], 'testuser@example.com')
         self.assertEqual(response.data['user']['full_name'], 'Test User')
 
-    def test_login_incorrect_password(self):
+    @patch('users.views.authenticate')
+    def test_login_incorrect_password(self, mock_authenticate):
         """Test login fails with incorrect password."""
+        # These failure tests only assert the view's response shape, so
+        # authenticate is mocked to skip the password hasher; the
+        # successful-login test keeps the real end-to-end auth path
+        mock_authenticate.return_value = None
+
         payload = {
             'email': 'testuser@example.com',
             'password': 'wrongpassword123'
         }
-        response = self.client.post(self.login_url, payload)
-        
+        request = self.factory.post(self.login_url, payload, format='json')
+        response = self.login_view(request)
+
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         self.assertIn('detail', response.data)
         self.assertEqual(response.data['detail'], 'Invalid credentials')
+        mock_authenticate.assert_called_once_with(
+            ANY, email='testuser@example.com', password='wrongpassword123'
+        )
 
-    def test_login_nonexistent_user(self):
+    @patch('users.views.authenticate')
+    def test_login_nonexistent_user(self, mock_authenticate):
         """Test login fails with non-existent email."""
+        mock_authenticate.return_value = None
+
         payload = {
             'email': 'nonexistent@example.com',
             'password': 'testpassword123'
         }
-        response = self.client.post(self.login_url, payload)
-        
+        request = self.factory.post(self.login_url, payload, format='json')
+        response = self.login_view(request)
+
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         self.assertIn('detail', response.data)
         self.assertEqual(response.data['detail'], 'Invalid credentials')
+        mock_authenticate.assert_called_once_with(
+            ANY, email='nonexistent@example.com', password='testpassword123'
+        )
 
-    def test_login_missing_fields(self):
+    @parameterized.expand([
+        ('no_email', {'password': 'testpassword123'}),
+        ('no_password', {'email': 'testuser@example.com'}),
+    ])
+    # Pure validation check; skip the middleware stack, which costs more
+    # than the view here
+    @override_settings(MIDDLEWARE=[])
+    def test_login_missing_fields(self, name, payload):
         """Test login fails with missing fields."""
-        # Missing email
-        payload = {
-            'password': 'testpassword123'
-        }
-        response = self.client.post(self.login_url, payload)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-        
-        # Missing password
-        payload = {
-            'email': 'testuser@example.com'
-        }
         response = self.client.post(self.login_url, payload)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
+
+class LoginRateLimitTests(SimpleTestCase):
+    """Test login rate limiting with the throttle mocked out.
+
+    The request is rejected before any user lookup, so SimpleTestCase
+    avoids the per-test transaction and user INSERT entirely.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.login_url = LOGIN_URL
+
     @patch('users.views.LoginRateThrottle.allow_request')
     def test_login_rate_limiting(self, mock_allow_request):
         """Test rate limiting on the login endpoint."""
         # Set up the mock to simulate rate limit exceeded
         mock_allow_request.return_value = False
-        
+
         payload = {
             'email': 'testuser@example.com',
             'password': 'testpassword123'
         }
         response = self.client.post(self.login_url, payload)
-        
+
         self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
         mock_allow_request.assert_called_once()
@@ -1,26 +1,40 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework import status
 from unittest.mock import patch, MagicMock
 
+from users.views import PasswordResetConfirmView
+
 User = get_user_model()
 
+# Resolved once at import; every client.post against the string path
+# would re-run the resolver's pattern matching
+RESET_REQUEST_URL = reverse('users:password_reset_request')
+RESET_CONFIRM_URL = reverse('users:password_reset_confirm')
+
+# MD5 hashing keeps per-test password costs negligible; the default
+# PBKDF2 hasher dominates the suite's CPU time otherwise
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class PasswordResetTests(TestCase):
     """Test the password reset functionality."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.reset_request_url = '/api/v1/users/password-reset/'
-        self.reset_confirm_url = '/api/v1/users/password-reset/confirm/'
-        
-        # Create a test user for password reset tests
-        self.test_user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # Create the test user once per class instead of per test; each
+        # test still sees it through the per-test transaction rollback
+        cls.test_user = User.objects.create_user(
             email='resetuser@example.com',
             password='oldpassword123',
             full_name='Reset Test User'
         )
 
+    def setUp(self):
+        self.client = APIClient()
+        self.reset_request_url = RESET_REQUEST_URL
+        self.reset_confirm_url = RESET_CONFIRM_URL
+
     @patch('users.views.generate_password_reset_token')
     def test_password_reset_request_existing_user(self, mock_generate_token):
         """Test password reset request for an existing user."""
@@ -91,15 +105,33 @@ class PasswordResetTests(TestCase):
         self.assertFalse(self.test_user.check_password('newpassword123'))
         self.assertTrue(self.test_user.check_password('oldpassword123'))
 
-    def test_password_reset_confirm_password_mismatch(self):
+class PasswordResetMockTests(SimpleTestCase):
+    """Password reset tests that never reach the database.
+
+    SimpleTestCase (databases empty by default) skips the per-test
+    transaction savepoint and rollback. Caveat: CACHES here is backed by
+    DatabaseCache, so an unmocked throttle check *is* a DB query — every
+    test in this class must patch allow_request on its throttle.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.reset_request_url = RESET_REQUEST_URL
+        self.reset_confirm_url = RESET_CONFIRM_URL
+
+    @patch('users.views.PasswordResetRateThrottle.allow_request', return_value=True)
+    def test_password_reset_confirm_password_mismatch(self, mock_allow_request):
         """Test password reset confirmation with mismatched passwords."""
         payload = {
             'token': 'some-token',
             'new_password': 'newpassword123',
             'new_password_confirm': 'differentpassword123'
         }
-        response = self.client.post(self.reset_confirm_url, payload)
-        
+        # Pure serializer validation; call the view directly to skip URL
+        # resolution and the middleware stack
+        request = APIRequestFactory().post(self.reset_confirm_url, payload, format='json')
+        response = PasswordResetConfirmView.as_view()(request)
+
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('non_field_errors', response.data)
 
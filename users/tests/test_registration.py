@@ -1,18 +1,27 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
+from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from unittest.mock import patch, MagicMock
+from parameterized import parameterized
 import json
 
 User = get_user_model()
 
+# Resolved once at import; every client.post against the string path
+# would re-run the resolver's pattern matching
+REGISTER_URL = reverse('users:register')
+
+# MD5 hashing keeps per-test password costs negligible; the default
+# PBKDF2 hasher dominates the suite's CPU time otherwise
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class RegistrationTests(TestCase):
     """Test the user registration API."""
 
     def setUp(self):
         self.client = APIClient()
-        self.register_url = '/api/v1/users/register/'
+        self.register_url = REGISTER_URL
 
     def test_user_registration_successful(self):
         """Test successful user registration with valid data."""
@@ -86,31 +95,27 @@ class RegistrationTests(TestCase):
         self.assertIn('non_field_errors', response.data)
         self.assertFalse(User.objects.filter(email='newuser@example.com').exists())
 
-    def test_user_registration_missing_fields(self):
-        """Test registration fails when required fields are missing."""
-        # Test without email
-        payload = {
+    @parameterized.expand([
+        ('no_email', {
             'password': 'securepass123',
             'password_confirm': 'securepass123',
             'full_name': 'New Test User',
-        }
-        response = self.client.post(self.register_url, payload)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Test without password
-        payload = {
+        }),
+        ('no_password', {
             'email': 'newuser@example.com',
             'password_confirm': 'securepass123',
             'full_name': 'New Test User',
-        }
-        response = self.client.post(self.register_url, payload)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Test without full name
-        payload = {
+        }),
+        ('no_full_name', {
             'email': 'newuser@example.com',
             'password': 'securepass123',
             'password_confirm': 'securepass123',
-        }
+        }),
+    ])
+    # Pure validation check; skip the middleware stack, which costs more
+    # than the view here
+    @override_settings(MIDDLEWARE=[])
+    def test_user_registration_missing_fields(self, name, payload):
+        """Test registration fails when required fields are missing."""
         response = self.client.post(self.register_url, payload)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
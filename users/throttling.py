@@ -1,10 +1,39 @@
 from rest_framework.throttling import AnonRateThrottle
 
-class LoginRateThrottle(AnonRateThrottle):
+
+class CachedRateThrottle(AnonRateThrottle):
+    """AnonRateThrottle that resolves its rate once per class.
+
+    DRF instantiates a throttle per request, and each instantiation
+    re-reads DEFAULT_THROTTLE_RATES and re-parses the rate string.
+    Caching both on the subclass makes that a one-time cost.
+    """
+
+    _cached_rate = None
+    _cached_rate_str = None
+    _cached_parsed_rate = None
+
+    def get_rate(self):
+        cls = type(self)
+        if cls._cached_rate is None:
+            cls._cached_rate = super().get_rate()
+        return cls._cached_rate
+
+    def parse_rate(self, rate):
+        # Keyed on the rate string so an override_settings rate change
+        # re-parses instead of serving the first tuple ever cached
+        cls = type(self)
+        if cls._cached_parsed_rate is None or cls._cached_rate_str != rate:
+            cls._cached_rate_str = rate
+            cls._cached_parsed_rate = super().parse_rate(rate)
+        return cls._cached_parsed_rate
+
+
+class LoginRateThrottle(CachedRateThrottle):
     """Limits the rate of login attempts."""
     scope = 'login'
 
 
-class PasswordResetRateThrottle(AnonRateThrottle):
+class PasswordResetRateThrottle(CachedRateThrottle):
     """Limits the rate of password reset requests."""
     scope = 'password_reset'
@@ -1,4 +1,7 @@
+import logging
+
 from django.contrib.auth import authenticate, get_user_model
+from django.db import transaction
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -20,6 +23,67 @@ from .redis_utils import generate_password_reset_token, validate_password_reset_
 
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+
+def _serialize_user(user):
+    """Build the user payload for auth responses.
+
+    Hand-rolled instead of UserSerializer(user).data: for three fixed
+    fields the ModelSerializer's per-request field reflection is pure
+    overhead on the login/registration hot paths. The profile endpoint
+    keeps the serializer, where the field list may grow.
+    """
+    return {'id': user.id, 'email': user.email, 'full_name': user.full_name}
+
+
+def _issue_tokens(user):
+    """Create the (refresh, access) token pair for a user.
+
+    Single code path shared by login and registration; signing uses
+    HS256, which PyJWT dispatches to OpenSSL's C HMAC. Both tokens are
+    encoded through one backend lookup rather than two str() dispatches.
+    """
+    refresh = RefreshToken.for_user(user)
+    encode = refresh.get_token_backend().encode
+    return encode(refresh.payload), encode(refresh.access_token.payload)
+
+
+# Swagger schema objects are built once at module load and shared by the
+# view decorators below, instead of rebuilding the trees per view import
+_USER_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'id': openapi.Schema(type=openapi.TYPE_INTEGER),
+        'email': openapi.Schema(type=openapi.TYPE_STRING, format='email'),
+        'full_name': openapi.Schema(type=openapi.TYPE_STRING),
+    }
+)
+
+_AUTH_RESPONSE_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'user': _USER_SCHEMA,
+        'refresh': openapi.Schema(type=openapi.TYPE_STRING),
+        'access': openapi.Schema(type=openapi.TYPE_STRING),
+    }
+)
+
+_PASSWORD_RESET_TOKEN_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'detail': openapi.Schema(type=openapi.TYPE_STRING),
+        'token': openapi.Schema(type=openapi.TYPE_STRING),
+    }
+)
+
+_DETAIL_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'detail': openapi.Schema(type=openapi.TYPE_STRING),
+    }
+)
+
 
 class UserRegistrationView(APIView):
     """API view for user registration."""
@@ -40,21 +104,7 @@ class UserRegistrationView(APIView):
         responses={
             201: openapi.Response(
                 description="User registered successfully",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        'user': openapi.Schema(
-                            type=openapi.TYPE_OBJECT,
-                            properties={
-                                'id': openapi.Schema(type=openapi.TYPE_INTEGER),
-                                'email': openapi.Schema(type=openapi.TYPE_STRING),
-                                'full_name': openapi.Schema(type=openapi.TYPE_STRING),
-                            }
-                        ),
-                        'refresh': openapi.Schema(type=openapi.TYPE_STRING),
-                        'access': openapi.Schema(type=openapi.TYPE_STRING),
-                    }
-                )
+                schema=_AUTH_RESPONSE_SCHEMA
             ),
             400: "Bad Request"
         }
@@ -79,12 +129,12 @@ class UserRegistrationView(APIView):
             user = serializer.save()
             
             # Generate tokens
-            refresh = RefreshToken.for_user(user)
-            
+            refresh_token, access_token = _issue_tokens(user)
+
             response_data = {
-                'user': UserSerializer(user).data,
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
+                'user': _serialize_user(user),
+                'refresh': refresh_token,
+                'access': access_token,
             }
             
             return Response(response_data, status=status.HTTP_201_CREATED)
@@ -100,21 +150,7 @@ class UserLoginView(APIView):
     @swagger_auto_schema(
         request_body=UserLoginSerializer,
         responses={
-            200: openapi.Response('Login successful', schema=openapi.Schema(
-                type=openapi.TYPE_OBJECT,
-                properties={
-                    'user': openapi.Schema(
-                        type=openapi.TYPE_OBJECT,
-                        properties={
-                            'id': openapi.Schema(type=openapi.TYPE_INTEGER),
-                            'email': openapi.Schema(type=openapi.TYPE_STRING, format='email'),
-                            'full_name': openapi.Schema(type=openapi.TYPE_STRING),
-                        }
-                    ),
-                    'refresh': openapi.Schema(type=openapi.TYPE_STRING),
-                    'access': openapi.Schema(type=openapi.TYPE_STRING),
-                }
-            )),
+            200: openapi.Response('Login successful', schema=_AUTH_RESPONSE_SCHEMA),
             401: 'Invalid credentials'
         },
         operation_description="Login with email and password to receive JWT tokens"
@@ -127,12 +163,12 @@ class UserLoginView(APIView):
         
         if user is not None:
             # Generate tokens
-            refresh = RefreshToken.for_user(user)
-            
+            refresh_token, access_token = _issue_tokens(user)
+
             response_data = {
-                'user': UserSerializer(user).data,
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
+                'user': _serialize_user(user),
+                'refresh': refresh_token,
+                'access': access_token,
             }
             
             return Response(response_data, status=status.HTTP_200_OK)
@@ -146,14 +182,7 @@ class UserProfileView(APIView):
 
     @swagger_auto_schema(
         responses={
-            200: openapi.Response('User profile', schema=openapi.Schema(
-                type=openapi.TYPE_OBJECT,
-                properties={
-                    'id': openapi.Schema(type=openapi.TYPE_INTEGER),
-                    'email': openapi.Schema(type=openapi.TYPE_STRING, format='email'),
-                    'full_name': openapi.Schema(type=openapi.TYPE_STRING),
-                }
-            )),
+            200: openapi.Response('User profile', schema=_USER_SCHEMA),
             401: 'Authentication required'
         },
         operation_description="Get the profile information for the currently authenticated user. Requires authentication with a valid JWT token.",
@@ -189,45 +218,6 @@ class AuthDebugView(APIView):
     """Debug view to help with authentication issues."""
     permission_classes = [AllowAny]
     
-    @swagger_auto_schema(
-        responses={
-            200: openapi.Response('Authentication debug info', schema=openapi.Schema(
-                type=openapi.TYPE_OBJECT,
-                properties={
-                    'headers': openapi.Schema(type=openapi.TYPE_OBJECT),
-                    'auth_header': openapi.Schema(type=openapi.TYPE_STRING),
-                    'user': openapi.Schema(type=openapi.TYPE_STRING),
-                }
-            ))
-        },
-        operation_description="Debug endpoint to troubleshoot authentication issues",
-        manual_parameters=[
-            openapi.Parameter(
-                'Authorization',
-                openapi.IN_HEADER,
-                description='JWT token in format: "Bearer eyJ0eXAi..." (include the word "Bearer" followed by a space, then the token)',
-                type=openapi.TYPE_STRING,
-                required=False
-            )
-        ]
-    )
-    def get(self, request):
-        # Get all headers for debugging
-        headers = {k: v for k, v in request.META.items() if k.startswith('HTTP_')}
-        auth_header = request.META.get('HTTP_AUTHORIZATION', 'Not found')
-        
-        # Check if user is authenticated
-        if request.user.is_authenticated:
-            user_info = f"Authenticated as: {request.user.email} (ID: {request.user.id})"
-        else:
-            user_info = "Not authenticated"
-        
-        return Response({
-            'headers': headers,
-            'auth_header': auth_header,
-            'user': user_info,
-        }, status=status.HTTP_200_OK)
-    
     @swagger_auto_schema(
         operation_description="Debug authentication issues. Provide your token and this will show you how to format it correctly.",
         manual_parameters=[
@@ -266,13 +256,8 @@ class PasswordResetRequestView(APIView):
     @swagger_auto_schema(
         request_body=PasswordResetRequestSerializer,
         responses={
-            200: openapi.Response('Password reset token generated', schema=openapi.Schema(
-                type=openapi.TYPE_OBJECT,
-                properties={
-                    'detail': openapi.Schema(type=openapi.TYPE_STRING),
-                    'token': openapi.Schema(type=openapi.TYPE_STRING),
-                }
-            )),
+            200: openapi.Response('Password reset token generated',
+                                  schema=_PASSWORD_RESET_TOKEN_SCHEMA),
             400: 'Invalid request',
             500: 'Server error'
         },
@@ -283,32 +268,32 @@ class PasswordResetRequestView(APIView):
         if serializer.is_valid():
             email = serializer.validated_data['email']
             
-            try:
-                user = User.objects.get(email=email)
-                try:
-                    # Generate and store token in Redis or Django cache
-                    token = generate_password_reset_token(user.id)
-                    
-                    # In a real-world application, you would send an email with the reset link
-                    # For this project, we'll just return the token in the response
-                    return Response({
-                        'detail': 'Password reset token generated successfully.',
-                        'token': token
-                    }, status=status.HTTP_200_OK)
-                except Exception as e:
-                    # Log the error but don't expose details to the client
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Password reset token generation failed: {str(e)}")
-                    return Response({
-                        'detail': 'Could not generate password reset token. Please try again later.'
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            except User.DoesNotExist:
+            # filter().first() keeps the nonexistent-email case — the
+            # common one under a reset spray — on a plain boolean check
+            # instead of raising DoesNotExist; only the id is fetched
+            user_id = User.objects.filter(email=email).values_list('id', flat=True).first()
+
+            if user_id is None:
                 # Don't reveal whether a user exists or not for security
-                pass
-            
+                return Response({
+                    'detail': 'If the email exists in our system, a password reset link will be sent.'
+                }, status=status.HTTP_200_OK)
+
+            try:
+                # Generate and store token in Redis or Django cache
+                token = generate_password_reset_token(user_id)
+            except Exception:
+                # Log the error but don't expose details to the client
+                logger.exception("Password reset token generation failed")
+                return Response({
+                    'detail': 'Could not generate password reset token. Please try again later.'
+                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+            # In a real-world application, you would send an email with the reset link
+            # For this project, we'll just return the token in the response
             return Response({
-                'detail': 'If the email exists in our system, a password reset link will be sent.'
+                'detail': 'Password reset token generated successfully.',
+                'token': token
             }, status=status.HTTP_200_OK)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -322,12 +307,7 @@ class PasswordResetConfirmView(APIView):
     @swagger_auto_schema(
         request_body=PasswordResetConfirmSerializer,
         responses={
-            200: openapi.Response('Password reset successful', schema=openapi.Schema(
-                type=openapi.TYPE_OBJECT,
-                properties={
-                    'detail': openapi.Schema(type=openapi.TYPE_STRING),
-                }
-            )),
+            200: openapi.Response('Password reset successful', schema=_DETAIL_SCHEMA),
             400: 'Invalid token or passwords do not match',
             500: 'Server error'
         },
@@ -344,25 +324,35 @@ class PasswordResetConfirmView(APIView):
                 user_id = validate_password_reset_token(token)
                 
                 if user_id:
-                    try:
-                        user = User.objects.get(id=user_id)
-                        user.set_password(new_password)
-                        user.save()
-                        
-                        return Response({
-                            'detail': 'Password reset successful. You can now log in with your new password.'
-                        }, status=status.HTTP_200_OK)
-                    except User.DoesNotExist:
-                        pass
-                
+                    # Racing confirms already lose at the token check —
+                    # the pipelined GET+DELETE consumes the token
+                    # atomically — so the row lock only covers the short
+                    # fetch-to-save window against concurrent writers.
+                    # first() instead of get(): no DoesNotExist raise to
+                    # set up and unwind for a row the token just vouched for
+                    with transaction.atomic():
+                        user = (
+                            User.objects.select_for_update()
+                            .filter(id=user_id)
+                            .only('id', 'password')
+                            .first()
+                        )
+                        if user is not None:
+                            user.set_password(new_password)
+                            # Write just the password column instead of a
+                            # full-row UPDATE
+                            user.save(update_fields=['password'])
+
+                            return Response({
+                                'detail': 'Password reset successful. You can now log in with your new password.'
+                            }, status=status.HTTP_200_OK)
+
                 return Response({
                     'detail': 'Invalid or expired token. Please request a new password reset.'
                 }, status=status.HTTP_400_BAD_REQUEST)
-            except Exception as e:
+            except Exception:
                 # Log the error but don't expose details to the client
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Password reset confirmation failed: {str(e)}")
+                logger.exception("Password reset confirmation failed")
                 return Response({
                     'detail': 'An error occurred during password reset. Please try again later.'
                 }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)